@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 
 from . import __version__
 
@@ -14,7 +14,8 @@ HEADERS: Dict[str, str] = {
 TILE_SIZE: int = 256
 
 # properties of the WGS 84 datum
-WGS84_ELLIPSOID = (6_378_137, 1 / 298.257223563)  # equatorial radius, flattening
+# equatorial radius, flattening
+WGS84_ELLIPSOID: Tuple[int, float] = (6_378_137, 1 / 298.257223563)
 R: float = WGS84_ELLIPSOID[0]
 C: int = 40_075_017  # equatorial circumference
 
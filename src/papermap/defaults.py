@@ -1,4 +1,5 @@
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 from .tile_server import TileServer
 
@@ -19,7 +20,7 @@ SIZE_TO_DIMENSIONS_MAP: Dict[str, Tuple[int, int]] = dict(
 SIZES = tuple(SIZE_TO_DIMENSIONS_MAP.keys())
 DEFAULT_SIZE: str = "a4"
 
-TILE_SERVERS_MAP: Dict[str, TileServer] = dict(
+_TILE_SERVERS_MAP: Dict[str, TileServer] = dict(
     [
         (
             "OpenStreetMap",
@@ -314,6 +315,7 @@ TILE_SERVERS_MAP: Dict[str, TileServer] = dict(
         ),
     ]
 )
+TILE_SERVERS_MAP: Mapping[str, TileServer] = MappingProxyType(_TILE_SERVERS_MAP)
 TILE_SERVERS = tuple(TILE_SERVERS_MAP.keys())
 DEFAULT_TILE_SERVER: str = "OpenStreetMap"
 
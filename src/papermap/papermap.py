@@ -114,7 +114,7 @@ class PaperMap:
             )
 
         # get the tile server mirrors
-        self.mirrors = self.tile_server.mirrors if self.tile_server.mirrors else []
+        self.mirrors = self.tile_server.mirrors if self.tile_server.mirrors else ()
 
         # check whether an API key is provided, if it is needed
         if (
@@ -345,12 +345,9 @@ class PaperMap:
                 with ThreadPoolExecutor(min(32, os.cpu_count() or 1 + 4)) as executor:
                     responses = executor.map(
                         session.get,
-                        [
-                            self.tile_server.format_url_template(
-                                tile=tile, api_key=self.api_key
-                            )
-                            for tile in tiles
-                        ],
+                        self.tile_server.format_url_templates(
+                            tiles=tiles, api_key=self.api_key
+                        ),
                     )
 
                     for tile, r in zip(tiles, responses):
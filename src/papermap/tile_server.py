@@ -1,9 +1,112 @@
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from itertools import cycle
-from typing import List, Optional, Union
+from string import Formatter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .tile import Tile
 
+URL_TEMPLATE_ARGUMENTS = ("mirror", "x", "y", "zoom", "api_key")
+
+# standard format specifier (without nested replacement fields), see
+# <https://docs.python.org/3/library/string.html#format-specification-mini-language>
+FORMAT_SPEC_PATTERN = re.compile(
+    r"(?:[^{}'\"\\\n]?[<>=^])?[+\- ]?#?0?\d*[_,]?(?:\.\d+)?[bcdeEfFgGnosxX%]?"
+)
+
+
+def parse_url_template(
+    url_template: str,
+) -> List[Tuple[str, Optional[str], str, Optional[str]]]:
+    """Parse a URL template into its literal text and placeholders.
+
+    Args:
+        url_template: The URL template to parse.
+
+    Returns:
+        The (literal text, placeholder name, format spec, conversion) tuples of
+        the URL template, where the placeholder name is `None` for trailing
+        literal text.
+
+    Raises:
+        ValueError: If the URL template contains an invalid placeholder, format
+            spec or conversion.
+    """
+    parsed = []
+    for literal, name, format_spec, conversion in Formatter().parse(url_template):
+        if name is not None:
+            if name not in URL_TEMPLATE_ARGUMENTS:
+                raise ValueError(f"Invalid placeholder in URL template: {name}")
+            if format_spec and not FORMAT_SPEC_PATTERN.fullmatch(format_spec):
+                raise ValueError(
+                    f"Invalid format spec in URL template: {{{name}:{format_spec}}}"
+                )
+            if conversion is not None and conversion not in ("r", "s", "a"):
+                raise ValueError(
+                    f"Invalid conversion in URL template: {{{name}!{conversion}}}"
+                )
+        parsed.append((literal, name, format_spec or "", conversion))
+    return parsed
+
+
+@lru_cache(maxsize=256)
+def compile_url_template(url_template: str) -> Callable[..., str]:
+    """Compile a URL template into a function that formats it.
+
+    The template is translated once into the source of a small function
+    returning an f-string, so formatting a URL does not require parsing the
+    template again. Only the placeholders present in the template are
+    evaluated, i.e. the mirrors are only advanced if the template contains
+    `{mirror}`. Compiled functions are cached per URL template.
+
+    Args:
+        url_template: The URL template to compile.
+
+    Returns:
+        A function taking the tile, the mirrors iterator and the API key
+        (positional) arguments and returning the formatted URL template.
+
+    Raises:
+        ValueError: If the URL template contains an invalid placeholder, format
+            spec or conversion.
+    """
+    parts = []
+    uses_mirror = False
+    for literal, name, format_spec, conversion in parse_url_template(url_template):
+        if literal:
+            parts.append(repr(literal))
+        if name is None:
+            continue
+        if name == "mirror":
+            uses_mirror = True
+        expression = name if name in ("mirror", "api_key") else f"tile.{name}"
+        if conversion is not None:
+            expression += f"!{conversion}"
+        if format_spec:
+            expression += f":{format_spec}"
+        parts.append(f"f'{{{expression}}}'")
+
+    lines = ["def format_url_template(tile, mirrors, api_key):"]
+    if uses_mirror:
+        # advance the mirrors once, even if the placeholder is repeated
+        lines.append("    mirror = next(mirrors)")
+    lines.append(f"    return {' '.join(parts) or repr('')}")
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<url_template>", "exec"), namespace)
+    return namespace["format_url_template"]
+
 
 @dataclass
 class TileServer:
@@ -15,23 +118,51 @@ class TileServer:
             are `{x}`, `{y}`, `{zoom}`, `{mirror}` and `{api_key}`, where `{x}`
             refers to the x coordinate of the tile, `{y}` refers to the y
             coordinate of the tile, `{zoom}` to the zoom level, `{mirror}` to
-            the mirror (optional) and `{api_key}` to the API key (optional). See
+            the mirror (optional) and `{api_key}` to the API key (optional).
+            Placeholders may use a conversion and/or format spec, as with
+            `str.format` (e.g. `{zoom:02d}`). See
             `<https://wiki.openstreetmap.org/wiki/Slippy_map_tilenames#Tile_servers>`_
             for more information.
         zoom_min: The minimum zoom level of the tile server.
         zoom_max: The maximum zoom level of the tile server.
         mirrors: The mirrors of the tile server. Defaults to `None`.
+        mirror_block_size: The number of consecutive tiles to request from the
+            same mirror before moving on to the next one. Defaults to `1`.
+
+    Raises:
+        ValueError: If the URL template contains an invalid placeholder.
+        ValueError: If the mirror block size is smaller than `1`.
     """
 
     attribution: str
     url_template: str
     zoom_min: int
     zoom_max: int
-    mirrors: Optional[List[Optional[Union[str, int]]]] = None
-    mirrors_cycle: cycle = field(init=False)
+    mirrors: Optional[Sequence[Optional[Union[str, int]]]] = None
+    mirror_block_size: int = 1
+    mirrors_cycle: cycle = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.mirrors_cycle = cycle(self.mirrors or [None])
+        # validate the URL template up front (it is only compiled on first use)
+        parse_url_template(self.url_template)
+
+        # store the mirrors as an immutable tuple
+        if self.mirrors is not None:
+            self.mirrors = tuple(self.mirrors)
+
+        if self.mirror_block_size < 1:
+            raise ValueError(
+                f"Mirror block size must be at least 1: {self.mirror_block_size}"
+            )
+
+        # repeat each mirror for a block of consecutive tiles
+        self.mirrors_cycle = cycle(
+            [
+                mirror
+                for mirror in self.mirrors or [None]
+                for _ in range(self.mirror_block_size)
+            ]
+        )
 
     def format_url_template(self, tile: Tile, api_key: Optional[str] = None) -> str:
         """Format the URL template with the tile's coordinates and zoom level.
@@ -42,11 +173,30 @@ class TileServer:
 
         Returns:
             The formatted URL template.
+
+        Raises:
+            ValueError: If the URL template contains an invalid placeholder.
         """
-        return self.url_template.format(
-            mirror=next(self.mirrors_cycle),
-            x=tile.x,
-            y=tile.y,
-            zoom=tile.zoom,
-            api_key=api_key,
-        )
+        # compiled on first use (and looked up by template, so that changes
+        # to the URL template are picked up)
+        format_ = compile_url_template(self.url_template)
+        return format_(tile, self.mirrors_cycle, api_key)
+
+    def format_url_templates(
+        self, tiles: Iterable[Tile], api_key: Optional[str] = None
+    ) -> List[str]:
+        """Format the URL template for multiple tiles at once.
+
+        Args:
+            tiles: The tiles to format the URL template with.
+            api_key: The API key to use. Defaults to `None`.
+
+        Returns:
+            The formatted URL templates, in the same order as the tiles.
+
+        Raises:
+            ValueError: If the URL template contains an invalid placeholder.
+        """
+        format_ = compile_url_template(self.url_template)
+        mirrors_cycle = self.mirrors_cycle
+        return [format_(tile, mirrors_cycle, api_key) for tile in tiles]
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 from math import (
     asinh,
     atan,
@@ -17,7 +18,7 @@ from math import (
 )
 from math import pi as π
 from string import Formatter
-from typing import Dict, Iterator, List, Union
+from typing import Dict, Iterator, Tuple, Union
 
 from .constants import FALSE_EASTING, FALSE_NORTHING, TILE_SIZE, WGS84_ELLIPSOID, C, R
 from .defaults import DEFAULT_DPI
@@ -258,14 +259,23 @@ def dd_to_dms(dd: Degree) -> DMS:
         dd: The Decimal Degrees.
 
     Returns:
-        The Degrees, Minutes, and Seconds.
+        The Degrees, Minutes, and Seconds. The sign is carried by the first
+        non-zero component.
     """
-    is_positive = dd >= 0
-    dd = abs(dd)
-    m, s = divmod(dd * 3600, 60)
-    d, m = divmod(m, 60)
-    d = d if is_positive else -d
-    return round(d), round(m), round(s, 6)
+    # convert to integer microarcseconds to avoid floating point artifacts
+    μas = round(dd * 3_600_000_000)
+    is_positive = μas >= 0
+    d, μas = divmod(abs(μas), 3_600_000_000)
+    m, μas = divmod(μas, 60_000_000)
+    s = μas / 1_000_000
+    if not is_positive:
+        if d:
+            d = -d
+        elif m:
+            m = -m
+        else:
+            s = -s
+    return d, m, s
 
 
 def dms_to_dd(dms: DMS) -> Degree:
@@ -278,9 +288,9 @@ def dms_to_dd(dms: DMS) -> Degree:
         The Decimal Degrees.
     """
     d, m, s = dms
-    is_positive = d >= 0
-    d = d if is_positive else -d
-    return round((d + m / 60 + s / 3600) * (1 if is_positive else -1), 6)
+    is_positive = d >= 0 and m >= 0 and s >= 0
+    dd = abs(d) + abs(m) / 60 + abs(s) / 3600
+    return round(dd if is_positive else -dd, 6)
 
 
 def spherical_to_cartesian(lat: Degree, lon: Degree, r: float = R) -> Cartesian_3D:
@@ -410,6 +420,61 @@ def compute_central_lon(zone: int) -> Degree:
     return (zone - 1) * 6 - 180 + 3
 
 
+# compute some quantities of the WGS 84 ellipsoid used throughout the UTM
+# conversions below (once, rather than on every conversion)
+_a, _f = WGS84_ELLIPSOID
+_e = sqrt(_f * (2 - _f))  # eccentricity
+_n = _f / (2 - _f)  # third flattening
+_k0 = 0.9996  # scale factor on central meridian
+
+# 2πA is the circumference of a meridian
+# (Karney, 2011, Eq. (14))
+_A = _a / (1 + _n) * (1 + _n**2 / 4 + _n**4 / 64 + _n**6 / 256)
+
+# (Karney, 2011, Eq. (35))
+_α = (
+    1,
+    _n / 2
+    - 2 * _n**2 / 3
+    + 5 * _n**3 / 16
+    + 41 * _n**4 / 180
+    - 127 * _n**5 / 288
+    + 7891 * _n**6 / 37800,
+    13 * _n**2 / 48
+    - 3 * _n**3 / 5
+    + 557 * _n**4 / 1440
+    + 281 * _n**5 / 630
+    - 1983433 * _n**6 / 1935360,
+    61 * _n**3 / 240
+    - 103 * _n**4 / 140
+    + 15061 * _n**5 / 26880
+    + 167603 * _n**6 / 181440,
+    49561 * _n**4 / 161280 - 179 * _n**5 / 168 + 6601661 * _n**6 / 7257600,
+    34729 * _n**5 / 80640 - 3418889 * _n**6 / 1995840,
+    212378941 * _n**6 / 319334400,
+)
+
+# (Karney, 2011, Eq. (36))
+_β = (
+    1,
+    _n / 2
+    - 2 * _n**2 / 3
+    + 37 * _n**3 / 96
+    - _n**4 / 360
+    - 81 * _n**5 / 512
+    + 96199 * _n**6 / 604800,
+    _n**2 / 48
+    + _n**3 / 15
+    - 437 * _n**4 / 1440
+    + 46 * _n**5 / 105
+    - 1118711 * _n**6 / 3870720,
+    17 * _n**3 / 480 - 37 * _n**4 / 840 - 209 * _n**5 / 4480 + 5569 * _n**6 / 90720,
+    4397 * _n**4 / 161280 - 11 * _n**5 / 504 - 830251 * _n**6 / 7257600,
+    4583 * _n**5 / 161280 - 108847 * _n**6 / 3991680,
+    20648693 * _n**6 / 638668800,
+)
+
+
 def spherical_to_utm(lat: Degree, lon: Degree) -> UTM_Coordinate:
     """Convert a spherical coordinate (i.e. lat, lon) to a UTM coordinate.
 
@@ -444,64 +509,30 @@ def spherical_to_utm(lat: Degree, lon: Degree) -> UTM_Coordinate:
     φ = radians(lat)
     λ = radians(lon) - λ0
 
-    # compute some quantities used throughout the equations below
-    a, f = WGS84_ELLIPSOID
-    e = sqrt(f * (2 - f))  # eccentricity
-    n = f / (2 - f)  # third flattening
-    n2 = n**2
-    n3 = n**3
-    n4 = n**4
-    n5 = n**5
-    n6 = n**6
-    k0 = 0.9996  # scale factor on central meridian
     λ_cos = cos(λ)
     λ_sin = sin(λ)
 
     # (Karney, 2011, Eqs. (7-9))
     τ = tan(φ)
-    σ = sinh(e * atanh(e * τ / sqrt(1 + τ**2)))
+    σ = sinh(_e * atanh(_e * τ / sqrt(1 + τ**2)))
     τʹ = τ * sqrt(1 + σ**2) - σ * sqrt(1 + τ**2)
 
     # (Karney, 2011, Eq. (10))
     ξʹ = atan2(τʹ, λ_cos)
     ηʹ = asinh(λ_sin / sqrt(τʹ**2 + λ_cos**2))
 
-    # (Karney, 2011, Eq. (35))
-    α = [
-        1,
-        n / 2
-        - 2 * n2 / 3
-        + 5 * n3 / 16
-        + 41 * n4 / 180
-        - 127 * n5 / 288
-        + 7891 * n6 / 37800,
-        13 * n2 / 48
-        - 3 * n3 / 5
-        + 557 * n4 / 1440
-        + 281 * n5 / 630
-        - 1983433 * n6 / 1935360,
-        61 * n3 / 240 - 103 * n4 / 140 + 15061 * n5 / 26880 + 167603 * n6 / 181440,
-        49561 * n4 / 161280 - 179 * n5 / 168 + 6601661 * n6 / 7257600,
-        34729 * n5 / 80640 - 3418889 * n6 / 1995840,
-        212378941 * n6 / 319334400,
-    ]
-
     # (Karney, 2011, Eq. (11))
     ξ = ξʹ
     for j in range(1, 7):
-        ξ += α[j] * sin(2 * j * ξʹ) * cosh(2 * j * ηʹ)
+        ξ += _α[j] * sin(2 * j * ξʹ) * cosh(2 * j * ηʹ)
     η = ηʹ
     for j in range(1, 7):
-        η += α[j] * cos(2 * j * ξʹ) * sinh(2 * j * ηʹ)
-
-    # 2πA is the circumference of a meridian
-    # (Karney, 2011, Eq. (14))
-    A = a / (1 + n) * (1 + n2 / 4 + n4 / 64 + n6 / 256)
+        η += _α[j] * cos(2 * j * ξʹ) * sinh(2 * j * ηʹ)
 
     # compute the x (easting) and y (northing)
     # (Karney, 2011, Eq. (13))
-    x = k0 * A * η
-    y = k0 * A * ξ
+    x = _k0 * _A * η
+    y = _k0 * _A * ξ
 
     # shift easting and northing to false origins
     x += FALSE_EASTING
@@ -535,48 +566,17 @@ def utm_to_spherical(x: float, y: float, zone: int, hemisphere: str) -> Spherica
     if hemisphere == "S":
         y -= FALSE_NORTHING
 
-    # compute some quantities used throughout the equations below
-    a, f = WGS84_ELLIPSOID
-    e = sqrt(f * (2 - f))  # eccentricity
-    n = f / (2 - f)  # third flattening
-    n2 = n**2
-    n3 = n**3
-    n4 = n**4
-    n5 = n**5
-    n6 = n**6
-    k0 = 0.9996  # scale factor on central meridian
-
-    # 2πA is the circumference of a meridian
-    # (Karney, 2011, Eq. (14))
-    A = a / (1 + n) * (1 + n2 / 4 + n4 / 64 + n6 / 256)
-
     # (Karney, 2011, Eq. (15))
-    ξ = y / (k0 * A)
-    η = x / (k0 * A)
-
-    # (Karney, 2011, Eq. (36))
-    β = [
-        1,
-        n / 2
-        - 2 * n2 / 3
-        + 37 * n3 / 96
-        - n4 / 360
-        - 81 * n5 / 512
-        + 96199 * n6 / 604800,
-        n2 / 48 + n3 / 15 - 437 * n4 / 1440 + 46 * n5 / 105 - 1118711 * n6 / 3870720,
-        17 * n3 / 480 - 37 * n4 / 840 - 209 * n5 / 4480 + 5569 * n6 / 90720,
-        4397 * n4 / 161280 - 11 * n5 / 504 - 830251 * n6 / 7257600,
-        4583 * n5 / 161280 - 108847 * n6 / 3991680,
-        20648693 * n6 / 638668800,
-    ]
+    ξ = y / (_k0 * _A)
+    η = x / (_k0 * _A)
 
     # (Karney, 2011, Eq. (11))
     ξʹ = ξ
     for j in range(1, 7):
-        ξʹ -= β[j] * sin(2 * j * ξ) * cosh(2 * j * η)
+        ξʹ -= _β[j] * sin(2 * j * ξ) * cosh(2 * j * η)
     ηʹ = η
     for j in range(1, 7):
-        ηʹ -= β[j] * cos(2 * j * ξ) * sinh(2 * j * η)
+        ηʹ -= _β[j] * cos(2 * j * ξ) * sinh(2 * j * η)
 
     ηʹ_sinh = sinh(ηʹ)
     ξʹ_cos = cos(ξʹ)
@@ -589,13 +589,13 @@ def utm_to_spherical(x: float, y: float, zone: int, hemisphere: str) -> Spherica
     δτi = 1.0
     τi = τʹ
     while abs(δτi) > 1e-12:
-        σi = sinh(e * atanh(e * τi / sqrt(1 + τi**2)))
+        σi = sinh(_e * atanh(_e * τi / sqrt(1 + τi**2)))
         τiʹ = τi * sqrt(1 + σi**2) - σi * sqrt(1 + τi**2)
         δτi = (
             (τʹ - τiʹ)
             / sqrt(1 + τiʹ**2)
-            * (1 + (1 - e**2) * τi**2)
-            / ((1 - e**2) * sqrt(1 + τi**2))
+            * (1 + (1 - _e**2) * τi**2)
+            / ((1 - _e**2) * sqrt(1 + τi**2))
         )
         τi += δτi
     τ = τi
@@ -610,8 +610,9 @@ def utm_to_spherical(x: float, y: float, zone: int, hemisphere: str) -> Spherica
     return lat, lon
 
 
-def get_string_formatting_arguments(s: str) -> List[str]:
-    return [t[1] for t in Formatter().parse(s) if t[1] is not None]
+@lru_cache(maxsize=256)
+def get_string_formatting_arguments(s: str) -> Tuple[str, ...]:
+    return tuple(t[1] for t in Formatter().parse(s) if t[1] is not None)
 
 
 def is_out_of_bounds(test: Dict[str, float], bounds: Dict[str, float]) -> bool: